@@ -1,4 +1,5 @@
 from .environment import NASimEnv
+from .vec_environment import VecNASimEnv
 import nasim.scenarios.benchmark as bm
 
 
@@ -9,7 +10,7 @@ def make_benchmark_env(scenario_name, seed=None, partially_obs=False):
         env = NASimEnv.from_params(partially_obs=partially_obs, **scenario)
     elif scenario_name in bm.AVAIL_STATIC_BENCHMARKS:
         scenario_file = bm.AVAIL_STATIC_BENCHMARKS[scenario_name]["file"]
-        env = NASimEnv.from_file(scenario_file, partially_obs)
+        env = NASimEnv.from_file(scenario_file, partially_obs, seed)
     else:
         raise NotImplementedError(f"Benchmark scenario '{scenario_name}' not available."
                                   f"Available scenarios are: {bm.AVAIL_BENCHMARKS}")
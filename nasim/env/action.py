@@ -13,6 +13,10 @@ class Action:
             This is None for scan type actions.
         3. target: the machine to launch action against. The machine is defined
             by the (subnet, machine_id) tuple
+
+    Actions loaded from the action space also store the index of their target in
+    the scenario address space (target_idx), so the network can look up the target
+    without hashing the address. For other actions target_idx is None.
     """
 
     def __init__(self, name, target, cost, prob=1.0):
@@ -30,6 +34,7 @@ class Action:
         """
         self.name = name
         self.target = target
+        self.target_idx = None
         self.cost = cost
         self.prob = prob
 
@@ -84,13 +89,17 @@ class Action:
             list of actions
         """
         action_space = []
-        for address in scenario.address_space:
-            action_space.append(ServiceScan("service_scan", address, scenario.service_scan_cost))
-            action_space.append(OSScan("os_scan", address, scenario.os_scan_cost))
-            action_space.append(SubnetScan("subnet_scan", address, scenario.subnet_scan_cost))
+        for address_idx, address in enumerate(scenario.address_space):
+            host_actions = [
+                ServiceScan("service_scan", address, scenario.service_scan_cost),
+                OSScan("os_scan", address, scenario.os_scan_cost),
+                SubnetScan("subnet_scan", address, scenario.subnet_scan_cost)
+            ]
             for e_name, e_def in scenario.exploits.items():
-                exploit = Exploit(e_name, address, **e_def)
-                action_space.append(exploit)
+                host_actions.append(Exploit(e_name, address, **e_def))
+            for action in host_actions:
+                action.target_idx = address_idx
+            action_space.extend(host_actions)
         return action_space
 
 
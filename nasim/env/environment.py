@@ -33,7 +33,7 @@ class NASimEnv:
     action_space = None
     current_state = None
 
-    def __init__(self, scenario, partially_obs=False):
+    def __init__(self, scenario, partially_obs=False, seed=None):
         """
         Arguments
         ---------
@@ -42,13 +42,16 @@ class NASimEnv:
         partially_obs : bool
             The observability mode of environment, if True then uses partially
             observable mode, otherwise is Fully observable (default=False)
+        seed : int, optional
+            random number generator seed for stochastic actions (default=None)
         """
         self.scenario = scenario
         self.fully_obs = not partially_obs
 
-        self.network = Network(scenario)
+        self.network = Network(scenario, seed)
         self.address_space = scenario.address_space
         self.action_space = Action.load_action_space(self.scenario)
+        self._num_sensitive = len(self.network.get_sensitive_hosts())
 
         self.current_state = State(self.network)
         self.last_obs = None
@@ -56,7 +59,7 @@ class NASimEnv:
         self.reset()
 
     @classmethod
-    def from_file(cls, path, partially_obs):
+    def from_file(cls, path, partially_obs, seed=None):
         """Construct Environment from a scenario file.
 
         Arguments
@@ -66,6 +69,8 @@ class NASimEnv:
         partially_obs : bool
             The observability mode of environment, if True then uses partially
             observable mode, otherwise is Fully observable
+        seed : int, optional
+            random number generator seed for stochastic actions (default=None)
 
         Returns
         -------
@@ -74,7 +79,7 @@ class NASimEnv:
         """
         loader = ScenarioLoader()
         scenario = loader.load(path)
-        return cls(scenario, partially_obs)
+        return cls(scenario, partially_obs, seed)
 
     @classmethod
     def from_params(cls, num_hosts, num_services, partially_obs, **params):
@@ -90,7 +95,8 @@ class NASimEnv:
             The observability mode of environment, if True then uses partially
             observable mode, otherwise is Fully observable
         params : dict
-            generator params (see scenarios.generator for full list)
+            generator params (see scenarios.generator for full list), the 'seed'
+            param is also used to seed the environment's stochastic actions
 
         Returns
         -------
@@ -99,7 +105,7 @@ class NASimEnv:
         """
         generator = ScenarioGenerator()
         scenario = generator.generate(num_hosts, num_services, **params)
-        return cls(scenario, partially_obs)
+        return cls(scenario, partially_obs, params.get("seed"))
 
     def reset(self):
         """Reset the state of the environment and returns the initial state.
@@ -307,8 +313,10 @@ class NASimEnv:
         return max_reward
 
     def _update_state(self, action, success):
-        """Updates the current state of environment based on if action was successful and the gained
-        service info
+        """Updates the current state of environment with the latest host status of network.
+
+        Only successful exploits and subnet scans can change the compromised, reachable
+        or discovered status of hosts, so the state is left unchanged for other steps.
 
         Arguments
         ---------
@@ -317,22 +325,14 @@ class NASimEnv:
         success : bool
             whether action was successful
         """
-        if not success:
-            return
-
-        if action.is_exploit() or action.is_subnet_scan():
-            for host_addr in self.address_space:
-                self.current_state.update(host_addr)
+        if success and (action.is_exploit() or action.is_subnet_scan()):
+            self.current_state.update_host_status()
 
     def _is_goal(self):
         """Check if the current state is the goal state.
         The goal state is  when all sensitive hosts have been compromised
         """
-        for sensitive_m in self.network.get_sensitive_hosts():
-            if not self.network.host_compromised(sensitive_m):
-                # at least one sensitive host not compromised
-                return False
-        return True
+        return self.network.num_sensitive_compromised == self._num_sensitive
 
     def __str__(self):
         output = "Environment: "
@@ -1,5 +1,10 @@
 import numpy as np
 
+# index of the host status values in host vector
+COMPROMISED_IDX = 0
+REACHABLE_IDX = 1
+DISCOVERED_IDX = 2
+
 
 class HostVector:
 
@@ -15,10 +20,12 @@ class HostVector:
         vector[self._reachable_idx] = int(host._reachable)
         vector[self._discovered_idx] = int(host._discovered)
         vector[self._value_idx] = host.value
-        for srv_num, srv_val in enumerate(host.services.values()):
-            vector[self._get_service_idx(srv_num)] = int(srv_val)
-        for os_num, os_val in enumerate(host.os.values()):
-            vector[self._get_os_idx(os_num)] = int(os_val)
+        vector[self._service_idx_slice] = np.fromiter(host.services.values(),
+                                                      dtype=np.float32,
+                                                      count=self.num_services)
+        vector[self._os_idx_slice] = np.fromiter(host.os.values(),
+                                                 dtype=np.float32,
+                                                 count=self.num_os)
         return vector
 
     def set_compromised(self, val):
@@ -49,15 +56,15 @@ class HostVector:
 
     @property
     def _compromised_idx(self):
-        return 0
+        return COMPROMISED_IDX
 
     @property
     def _reachable_idx(self):
-        return self._compromised_idx+1
+        return REACHABLE_IDX
 
     @property
     def _discovered_idx(self):
-        return self._reachable_idx+1
+        return DISCOVERED_IDX
 
     @property
     def _value_idx(self):
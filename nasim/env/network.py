@@ -7,6 +7,14 @@ from .action_obs import ActionObservation
 # column in topology adjacency matrix that represents connection between subnet and public
 INTERNET = 0
 
+# outcomes of checking an action against the current network state
+ACTION_INVALID = 0
+ACTION_VALID = 1
+ACTION_REPEAT_EXPLOIT = 2
+
+# number of random numbers drawn at a time for stochastic actions
+RAND_BUFFER_SIZE = 4096
+
 
 class Network:
     """A simulated network of hosts belonging to different subnetworks.
@@ -22,14 +30,17 @@ class Network:
         objects as values
     - firewall - a 3D matrix defining which services are allowed between source and destination
         subnets
+    - compromised_subnets - bool array indicating which subnets have been compromised
     """
 
-    def __init__(self, scenario):
+    def __init__(self, scenario, seed=None):
         """
         Arguments
         ---------
         scenario : Scenario
             scenario definition
+        seed : int, optional
+            random number generator seed for stochastic actions (default=None)
         """
         self.scenario = scenario
         self.subnets = scenario.subnets
@@ -39,18 +50,56 @@ class Network:
         self.firewall = scenario.firewall
         self.address_space = scenario.address_space
         self.sensitive_addresses = self._get_sensitive_addresses()
-        self.compromised_subnets = None
+        self.compromised_subnets = np.zeros(len(self.subnets), dtype=bool)
+
+        # static arrays used for vectorized reachability updates
+        self.host_num_map = {addr: i for i, addr in enumerate(self.address_space)}
+        self.host_list = [self.hosts[addr] for addr in self.address_space]
+        self.host_subnets = np.array([addr[0] for addr in self.address_space], dtype=np.int32)
+        self.host_discovery_values = np.array([h.discovery_value for h in self.host_list])
+        self.host_sensitive = np.array([addr in self.sensitive_hosts for addr in self.address_space],
+                                       dtype=bool)
+        self.num_sensitive_compromised = 0
+        self.subnet_connectivity = np.asarray(self.topology) == 1
+
+        # host status arrays, kept in sync with the host objects
+        self.compromised_array = np.zeros(len(self.address_space), dtype=bool)
+        self.reachable_array = np.zeros(len(self.address_space), dtype=bool)
+        self.discovered_array = np.zeros(len(self.address_space), dtype=bool)
+
+        # static (src subnet, dest subnet, service) firewall table and the running
+        # (dest subnet, service) mask permitted from the current compromised subnets
+        self.service_idx_map = {srv: i for i, srv in enumerate(scenario.services)}
+        self.traffic_permitted = self._get_traffic_permitted_table()
+        self.permitted_mask = None
+
+        # static (host, service) and (host, os) presence arrays
+        self.os_idx_map = {os: i for i, os in enumerate(scenario.os)}
+        self.host_services = np.array([[self.hosts[addr].services[srv] for srv in self.service_idx_map]
+                                       for addr in self.address_space], dtype=bool)
+        self.host_os = np.array([[self.hosts[addr].os[os] for os in self.os_idx_map]
+                                 for addr in self.address_space], dtype=bool)
+
+        self._rng = np.random.default_rng(seed)
+        self._rand_buffer = self._rng.random(RAND_BUFFER_SIZE)
+        self._rand_idx = 0
 
     def reset(self):
         """Reset network to initial state.
 
         This only changes the compromised and reachable status of each host in network.
         """
-        self.compromised_subnets = set([INTERNET])
+        self.compromised_subnets[:] = False
+        self.compromised_subnets[INTERNET] = True
+        self.permitted_mask = self.traffic_permitted[INTERNET].copy()
         for host_addr, host in self.hosts.items():
             host.compromised = False
             host.reachable = self.subnet_public(host_addr[0])
             host.discovered = host.reachable
+        self.compromised_array[:] = False
+        self.num_sensitive_compromised = 0
+        self.reachable_array[:] = self.subnet_connectivity[self.host_subnets, INTERNET]
+        self.discovered_array[:] = self.reachable_array
 
     def perform_action(self, action, fully_obs):
         """Perform the given Action against the network.
@@ -65,79 +114,104 @@ class Network:
         ActionObservation
             the result from the action
         """
-        # check if valid target host
-        tgt_subnet, tgt_id = action.target
-        assert 0 < tgt_subnet and tgt_subnet < len(self.subnets)
-        assert tgt_id <= self.subnets[tgt_subnet]
+        host_idx = action.target_idx
+        if host_idx is None:
+            # action not from action space, so check if valid target host
+            assert action.target in self.host_num_map, f"Invalid target host {action.target}"
+            host_idx = self.host_num_map[action.target]
 
-        if not self.host_reachable(action.target):
-            # print("host not reachable")
-            return ActionObservation(False, 0.0)
-
-        if not self.host_discovered(action.target):
-            # print("host not discovered")
-            return ActionObservation(False, 0.0)
+        check = self._check_action(action, host_idx)
 
-        if action.is_exploit() and not self.host_service_traffic_permitted(action.target, action.service):
-            # print("Traffic not permitted")
-            # exploit action and host and/or service blocked by firewall
+        if check == ACTION_INVALID:
+            # host not reachable or discovered, or traffic blocked by firewall
             return ActionObservation(False, 0.0)
 
-        if action.is_exploit() and self.host_compromised(action.target):
+        if check == ACTION_REPEAT_EXPLOIT:
             # print("Host already compromised")
             # host already compromised so exploit will work
-            t_host = self.hosts[action.target]
-            return t_host.perform_action(action)
+            return self.host_list[host_idx].perform_action(action)
 
         # non-deterministic actions
-        if np.random.rand() > action.prob:
+        if self._next_rand() > action.prob:
             # print("Stochastic action fail")
             return ActionObservation(False, 0.0)
 
         # action is valid
         if action.is_subnet_scan():
             # print("Performing subnet scan")
-            return self._perform_subnet_scan(action)
+            return self._perform_subnet_scan(host_idx)
 
-        t_host = self.hosts[action.target]
-        action_obs = t_host.perform_action(action)
-        self._update(action, action_obs, fully_obs)
+        action_obs = self.host_list[host_idx].perform_action(action)
+        self._update(action, host_idx, action_obs)
         return action_obs
 
-    def _perform_subnet_scan(self, action):
-        if not self.host_compromised(action.target):
+    def _check_action(self, action, host_idx):
+        """Check whether an action can be performed given the current network state.
+
+        Arguments
+        ---------
+        action : Action
+            the action to check
+        host_idx : int
+            index of target host
+
+        Returns
+        -------
+        int
+            ACTION_INVALID if action fails, ACTION_REPEAT_EXPLOIT if action is an exploit
+            against an already compromised host, otherwise ACTION_VALID
+        """
+        if not self.reachable_array[host_idx] or not self.discovered_array[host_idx]:
+            return ACTION_INVALID
+        if action.is_exploit():
+            service = self.service_idx_map[action.service]
+            if not self.permitted_mask[self.host_subnets[host_idx], service]:
+                return ACTION_INVALID
+            if self.compromised_array[host_idx]:
+                return ACTION_REPEAT_EXPLOIT
+        return ACTION_VALID
+
+    def _next_rand(self):
+        """Get next random number in [0, 1), drawing a new batch when buffer is used up """
+        if self._rand_idx == RAND_BUFFER_SIZE:
+            self._rand_buffer = self._rng.random(RAND_BUFFER_SIZE)
+            self._rand_idx = 0
+        rand = self._rand_buffer[self._rand_idx]
+        self._rand_idx += 1
+        return rand
+
+    def _perform_subnet_scan(self, host_idx):
+        if not self.compromised_array[host_idx]:
             # can only perform subnet scan from compromised host
             return ActionObservation(False, 0.0)
 
-        discovered = {}
-        discovery_reward = 0
-        target_subnet = action.target[0]
-        for h_addr, host in self.hosts.items():
-            if self.subnets_connected(target_subnet, h_addr[0]):
-                discovered[h_addr] = True
-                if not host.discovered:
-                    host.discovered = True
-                    discovery_reward += host.discovery_value
-            else:
-                discovered[h_addr] = False
+        connected = self.subnet_connectivity[self.host_subnets[host_idx]][self.host_subnets]
+        newly_discovered = connected & ~self.discovered_array
+        self.discovered_array |= newly_discovered
+        for d_idx in np.flatnonzero(newly_discovered):
+            self.host_list[d_idx].discovered = True
+        discovery_reward = self.host_discovery_values[newly_discovered].sum()
+        discovered = dict(zip(self.address_space, connected.tolist()))
         return ActionObservation(True, discovery_reward, discovered=discovered)
 
-    def _update(self, action, action_obs, fully_obs):
+    def _update(self, action, host_idx, action_obs):
         if action.is_exploit() and action_obs.success:
-            self.compromised_subnets.add(action.target[0])
-            self._update_reachable(action.target, fully_obs)
-
-    def _update_reachable(self, compromised_addr, fully_obs):
+            comp_subnet = self.host_subnets[host_idx]
+            self._set_compromised(host_idx)
+            if not self.compromised_subnets[comp_subnet]:
+                self.compromised_subnets[comp_subnet] = True
+                self.permitted_mask |= self.traffic_permitted[comp_subnet]
+            self._update_reachable(comp_subnet)
+
+    def _update_reachable(self, comp_subnet):
         """Updates the reachable status of hosts on network, based on current state and newly
-        exploited host
+        compromised subnet
         """
-        comp_subnet = compromised_addr[0]
-        for addr in self.address_space:
-            if self.host_reachable(addr):
-                continue
-            host_subnet = addr[0]
-            if self.subnets_connected(comp_subnet, host_subnet):
-                self.set_host_reachable(addr)
+        newly_reachable = self.subnet_connectivity[comp_subnet][self.host_subnets]
+        newly_reachable &= ~self.reachable_array
+        self.reachable_array |= newly_reachable
+        for r_idx in np.flatnonzero(newly_reachable):
+            self.host_list[r_idx].reachable = True
 
     def get_sensitive_hosts(self):
         return self.sensitive_addresses
@@ -146,31 +220,43 @@ class Network:
         return host_address in self.sensitive_addresses
 
     def host_reachable(self, host_addr):
-        return self.hosts[host_addr].reachable
+        return self.reachable_array[self.host_num_map[host_addr]]
 
     def host_compromised(self, host_addr):
-        return self.hosts[host_addr].compromised
+        return self.compromised_array[self.host_num_map[host_addr]]
 
     def host_discovered(self, host_addr):
-        return self.hosts[host_addr].discovered
+        return self.discovered_array[self.host_num_map[host_addr]]
 
     def set_host_compromised(self, host_addr):
         self.hosts[host_addr].compromised = True
+        self._set_compromised(self.host_num_map[host_addr])
+
+    def _set_compromised(self, host_idx):
+        if not self.compromised_array[host_idx]:
+            self.compromised_array[host_idx] = True
+            if self.host_sensitive[host_idx]:
+                self.num_sensitive_compromised += 1
 
     def set_host_reachable(self, host_addr):
         self.hosts[host_addr].reachable = True
+        self.reachable_array[self.host_num_map[host_addr]] = True
 
     def set_host_discovered(self, host_addr):
         self.hosts[host_addr].discovered = True
+        self.discovered_array[self.host_num_map[host_addr]] = True
 
     def get_host_value(self, host_address):
         return self.hosts[host_address].get_value()
 
     def host_is_running_service(self, host_addr, service):
-        return self.hosts[host_addr].service_present(service)
+        return self.host_services[self.host_num_map[host_addr], self.service_idx_map[service]]
 
     def host_is_running_os(self, host_addr, os):
-        return self.hosts[host_addr].is_running_os(os)
+        if os is None:
+            # hosts os maps include a None entry that is never running
+            return False
+        return self.host_os[self.host_num_map[host_addr], self.os_idx_map[os]]
 
     def subnets_connected(self, subnet_1, subnet_2):
         return self.topology[subnet_1][subnet_2] == 1
@@ -187,10 +273,7 @@ class Network:
         """Checks whether the firewall permits traffic to a given host and service,
         based on current set of compromised hosts on network.
         """
-        for src in self.compromised_subnets:
-            if self.subnet_traffic_permitted(src, host_addr[0], service):
-                return True
-        return False
+        return self.permitted_mask[host_addr[0], self.service_idx_map[service]]
 
     def subnet_public(self, subnet):
         return self.topology[subnet][INTERNET] == 1
@@ -264,6 +347,18 @@ class Network:
             total_value += host_value
         return total_value
 
+    def _get_traffic_permitted_table(self):
+        """Get a (src subnet, dest subnet, service) boolean table of whether the
+        firewall permits traffic, to store for later efficiency
+        """
+        num_subnets = len(self.subnets)
+        table = np.zeros((num_subnets, num_subnets, len(self.service_idx_map)), dtype=bool)
+        for src in range(num_subnets):
+            for dest in range(num_subnets):
+                for srv, srv_idx in self.service_idx_map.items():
+                    table[src, dest, srv_idx] = self.subnet_traffic_permitted(src, dest, srv)
+        return table
+
     def _get_sensitive_addresses(self):
         """Get addresses of hosts which contain sensitive hosts, to store
         for later efficiency
@@ -0,0 +1,215 @@
+"""Parallel rollouts of the network attack simulator environment using Ray.
+
+Each actor owns a persistent NASimEnv, so the scenario and network only cross the
+process boundary once when the actor is created and each step only returns the
+numpy observation tensor, reward and done flag.
+
+Vectorized actors each own a VecNASimEnv built from a single copy of the static
+environment arrays placed in the Ray object store, so the static arrays are
+shared read-only by all actors on a node rather than copied into each one.
+
+N.B. requires Ray to be installed (pip install ray), which is not a default
+dependency of nasim.
+"""
+import copy
+
+import numpy as np
+import ray
+
+from nasim.env.environment import NASimEnv
+from nasim.env.vec_environment import EnvStatic, VecNASimEnv
+
+
+@ray.remote(num_cpus=1)
+class RayNASimEnvActor:
+    """A Ray actor holding a single network attack simulator environment """
+
+    def __init__(self, scenario, partially_obs=False, seed=None):
+        """
+        Arguments
+        ---------
+        scenario : Scenario
+            Scenario object, defining the properties of the environment
+        partially_obs : bool
+            The observability mode of environment, if True then uses partially
+            observable mode, otherwise is Fully observable (default=False)
+        seed : int, optional
+            random number generator seed for stochastic actions (default=None)
+        """
+        # arrays deserialized from the object store are read-only, and the env
+        # mutates the scenario hosts, so each actor needs its own copy
+        self.env = NASimEnv(copy.deepcopy(scenario), partially_obs, seed)
+
+    def reset(self):
+        """Reset the environment.
+
+        Returns
+        -------
+        ndarray
+            the initial observation as a 2D numpy array
+        """
+        return self.env.reset().numpy_2D()
+
+    def step(self, action):
+        """Run one step of the environment.
+
+        Arguments
+        ---------
+        action : int
+            index of action in action space
+
+        Returns
+        -------
+        obs : ndarray
+            observation as a 2D numpy array
+        reward : float
+            reward from performing action
+        done : bool
+            whether the episode has ended or not
+        """
+        obs, reward, done, _ = self.env.step(int(action))
+        return obs.numpy_2D(), reward, done
+
+    def step_k(self, actions):
+        """Run a sequence of steps of the environment, to amortize the cost of
+        each remote call over multiple steps.
+
+        The environment is reset whenever an episode ends, so the sequence may span
+        multiple episodes.
+
+        Arguments
+        ---------
+        actions : list
+            list of indices of actions in action space
+
+        Returns
+        -------
+        obs : ndarray
+            (k, num_hosts, host_vector_size) observation after each step
+        rewards : ndarray
+            (k, ) reward from each step
+        dones : ndarray
+            (k, ) whether the episode ended after each step
+        """
+        obs = np.zeros((len(actions), *self.env.get_obs_shape(flat=False)), dtype=np.float32)
+        rewards = np.zeros(len(actions), dtype=np.float32)
+        dones = np.zeros(len(actions), dtype=bool)
+        for t, a in enumerate(actions):
+            o, rewards[t], dones[t], _ = self.env.step(int(a))
+            obs[t] = o.numpy_2D()
+            if dones[t]:
+                self.env.reset()
+        return obs, rewards, dones
+
+
+@ray.remote(num_cpus=1)
+class RayVecNASimEnvActor:
+    """A Ray actor holding a batch of network attack simulator environments """
+
+    def __init__(self, static, num_envs, seed=None):
+        """
+        Arguments
+        ---------
+        static : EnvStatic
+            the static environment arrays (pass the ObjectRef from ray.put so the
+            arrays are shared rather than copied)
+        num_envs : int
+            number of environments in batch
+        seed : int, optional
+            random number generator seed (default=None)
+        """
+        self.env = VecNASimEnv.from_static(static, num_envs, seed)
+
+    def reset(self, mask=None):
+        """Reset environments in batch (see VecNASimEnv.reset) """
+        return self.env.reset(mask)
+
+    def step(self, actions):
+        """Run one step of each environment in batch.
+
+        Arguments
+        ---------
+        actions : ndarray
+            (num_envs, ) array of action space indices
+
+        Returns
+        -------
+        obs : ndarray
+            (num_envs, num_hosts, host_vector_size) state of each environment
+        rewards : ndarray
+            (num_envs, ) reward from performing each action
+        dones : ndarray
+            (num_envs, ) whether each episode has ended or not
+        """
+        obs, rewards, dones, _ = self.env.step(actions)
+        return obs, rewards, dones
+
+
+def create_actors(scenario, num_actors, partially_obs=False, seed=None):
+    """Create a list of environment actors for the given scenario.
+
+    Arguments
+    ---------
+    scenario : Scenario
+        Scenario object, defining the properties of the environment
+    num_actors : int
+        number of actors to create
+    partially_obs : bool
+        The observability mode of environment (default=False)
+    seed : int, optional
+        base random number generator seed, each actor is seeded with seed + actor
+        number (default=None)
+
+    Returns
+    -------
+    list
+        list of RayNASimEnvActor handles
+    """
+    seeds = [None if seed is None else seed + i for i in range(num_actors)]
+    return [RayNASimEnvActor.remote(scenario, partially_obs, s) for s in seeds]
+
+
+def step_actors(actors, actions):
+    """Run a sequence of steps on each actor in parallel.
+
+    Arguments
+    ---------
+    actors : list
+        list of RayNASimEnvActor handles
+    actions : list
+        list containing the sequence of action indices for each actor
+
+    Returns
+    -------
+    list
+        list of (obs, rewards, dones) tuples, one for each actor (see
+        RayNASimEnvActor.step_k)
+    """
+    assert len(actors) == len(actions)
+    return ray.get([actor.step_k.remote(a) for actor, a in zip(actors, actions)])
+
+
+def create_vec_actors(scenario, num_actors, num_envs, seed=None):
+    """Create a list of vectorized environment actors for the given scenario, which
+    all share a single copy of the static environment arrays.
+
+    Arguments
+    ---------
+    scenario : Scenario
+        Scenario object, defining the properties of the environment
+    num_actors : int
+        number of actors to create
+    num_envs : int
+        number of environments in batch of each actor
+    seed : int, optional
+        base random number generator seed, each actor is seeded with seed + actor
+        number (default=None)
+
+    Returns
+    -------
+    list
+        list of RayVecNASimEnvActor handles
+    """
+    static_ref = ray.put(EnvStatic.from_scenario(scenario))
+    seeds = [None if seed is None else seed + i for i in range(num_actors)]
+    return [RayVecNASimEnvActor.remote(static_ref, num_envs, s) for s in seeds]
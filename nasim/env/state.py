@@ -1,6 +1,7 @@
 import numpy as np
 
 from .observation import Observation
+from .host_vector import COMPROMISED_IDX, REACHABLE_IDX, DISCOVERED_IDX
 
 
 class State:
@@ -18,18 +19,38 @@ class State:
             the network object for the environment
         """
         self.network = network
+        self.host_num_map = network.host_num_map
+        self._initial_tensor = None
         self._tensor = self._tensorize()
 
     def _tensorize(self):
         """Create a numpy tensor version of state """
-        h0 = self.network.hosts[(1, 0)]
-        tensor = np.zeros((len(self.network.hosts), h0.state_size), dtype=np.float32)
-        for host_num, host in enumerate(self.network.hosts.values()):
-            tensor[host_num] = host.numpy()
-        return tensor
+        return np.stack([host.numpy() for host in self.network.hosts.values()])
 
     def reset(self):
-        self._tensor = self._tensorize()
+        """Reset state tensor to the initial state of the network.
+
+        N.B. assumes the network has already been reset. The initial tensor is
+        built on first reset and then copied for every following reset.
+        """
+        if self._initial_tensor is None:
+            self._initial_tensor = self._tensorize()
+        self._tensor = self._initial_tensor.copy()
+
+    def copy(self):
+        """Get a copy of this state, sharing the same network.
+
+        Returns
+        -------
+        State
+            a copy of the state
+        """
+        new_state = State.__new__(State)
+        new_state.network = self.network
+        new_state.host_num_map = self.host_num_map
+        new_state._initial_tensor = self._initial_tensor
+        new_state._tensor = self._tensor.copy()
+        return new_state
 
     def get_initial_observation(self, fully_obs):
         """Get the initial observation of network.
@@ -110,22 +131,18 @@ class State:
         obs.update_from_host(target_idx, target_obs)
         return obs
 
-    def update(self, host_addr):
-        """Updates the state tensor with latest state of given host
-
-        Arguments
-        ---------
-        host_addr : (int, int)
-            the address of host to update state for
+    def update_host_status(self):
+        """Updates the compromised, reachable and discovered status of every host in
+        state tensor with latest status from network
         """
-        host_idx, host = self.get_host_and_idx(host_addr)
-        self._tensor[host_idx] = host.numpy()
+        self._tensor[:, COMPROMISED_IDX] = self.network.compromised_array
+        self._tensor[:, REACHABLE_IDX] = self.network.reachable_array
+        self._tensor[:, DISCOVERED_IDX] = self.network.discovered_array
 
     def get_host_and_idx(self, host_addr):
-        for host_idx, host in enumerate(self.network.hosts.values()):
-            if host.address == host_addr:
-                return host_idx, host
-        raise AssertionError(f"Host Address '{host_addr}' invalid. Bad format or not in network.")
+        if host_addr not in self.host_num_map:
+            raise AssertionError(f"Host Address '{host_addr}' invalid. Bad format or not in network.")
+        return self.host_num_map[host_addr], self.network.hosts[host_addr]
 
     def flat_size(self):
         """Return the size of state in terms of the flattened state.
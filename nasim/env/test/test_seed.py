@@ -0,0 +1,66 @@
+import unittest
+import numpy as np
+from nasim.env.environment import NASimEnv
+from nasim.env.network import RAND_BUFFER_SIZE
+from nasim.scenarios import ScenarioGenerator
+
+
+class SeedTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.M = 10
+        self.S = 3
+        self.seed = 5
+
+    def get_env(self, seed):
+        # stochastic exploits, so env outcomes depend on env random number generator
+        generator = ScenarioGenerator()
+        scenario = generator.generate(self.M, self.S, exploit_probs=0.5, seed=1)
+        return NASimEnv(scenario, seed=seed)
+
+    def count_rand_draws(self, env):
+        """Wrap env network random number draws with a counter """
+        network = env.network
+        next_rand = network._next_rand
+        network.num_draws = 0
+
+        def counted_next_rand():
+            network.num_draws += 1
+            return next_rand()
+
+        network._next_rand = counted_next_rand
+
+    def run_episodes(self, env, num_steps):
+        rng = np.random.RandomState(self.seed)
+        rewards, successes = [], []
+        env.reset()
+        for t in range(num_steps):
+            _, r, d, info = env.step(int(rng.randint(len(env.action_space))))
+            rewards.append(r)
+            successes.append(info["success"])
+            if d:
+                env.reset()
+        return rewards, successes
+
+    def test_same_seed(self):
+        env_a = self.get_env(self.seed)
+        env_b = self.get_env(self.seed)
+        self.assertEqual(self.run_episodes(env_a, 500), self.run_episodes(env_b, 500))
+
+    def test_same_seed_buffer_refill(self):
+        env_a = self.get_env(self.seed)
+        env_b = self.get_env(self.seed)
+        self.count_rand_draws(env_a)
+        num_steps = 20 * RAND_BUFFER_SIZE
+        self.assertEqual(self.run_episodes(env_a, num_steps),
+                         self.run_episodes(env_b, num_steps))
+        self.assertGreater(env_a.network.num_draws, 2 * RAND_BUFFER_SIZE)
+
+    def test_different_seed(self):
+        env_a = self.get_env(self.seed)
+        env_b = self.get_env(self.seed + 1)
+        self.assertNotEqual(self.run_episodes(env_a, 500), self.run_episodes(env_b, 500))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import numpy as np
+from nasim.env.environment import NASimEnv
+from nasim.env.vec_environment import VecNASimEnv, EnvStatic
+from nasim.scenarios import ScenarioGenerator
+
+
+class VecEnvironmentTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 4
+        self.M = 20
+        self.S = 4
+        self.seed = 3
+        self.vec_env = VecNASimEnv(self.get_scenario(), self.N, self.seed)
+
+    def get_scenario(self):
+        # deterministic exploits so batch and single envs can be compared
+        generator = ScenarioGenerator()
+        return generator.generate(self.M, self.S, exploit_probs=1.0,
+                                  restrictiveness=3, seed=self.seed)
+
+    def test_reset(self):
+        envs = [NASimEnv(self.get_scenario()) for _ in range(self.N)]
+        actual_obs = self.vec_env.reset()
+        for i, env in enumerate(envs):
+            expected_obs = env.reset()
+            self.assertTrue(np.array_equal(actual_obs[i], expected_obs.numpy_2D()))
+
+    def test_reset_mask(self):
+        for a in range(self.vec_env.get_num_actions()):
+            self.vec_env.step(np.full(self.N, a))
+        initial_obs = self.vec_env.get_state()
+        mask = np.array([True, False] * (self.N // 2))
+        actual_obs = self.vec_env.reset(mask)
+        expected_obs = VecNASimEnv(self.get_scenario(), self.N).get_state()
+        self.assertTrue(np.array_equal(actual_obs[mask], expected_obs[mask]))
+        self.assertTrue(np.array_equal(actual_obs[~mask], initial_obs[~mask]))
+
+    def test_from_static(self):
+        static = EnvStatic.from_scenario(self.get_scenario())
+        for arr in static:
+            self.assertFalse(arr.flags.writeable)
+            self.assertTrue(arr.flags.c_contiguous)
+        env_a = VecNASimEnv.from_static(static, self.N, self.seed)
+        env_b = VecNASimEnv.from_static(static, self.N, self.seed)
+        self.assertIs(env_a.static, env_b.static)
+        rng = np.random.RandomState(self.seed)
+        for t in range(200):
+            actions = rng.randint(static.num_actions, size=self.N)
+            obs, r, d, _ = env_a.step(actions)
+            expected_obs, expected_r, expected_d, _ = self.vec_env.step(actions)
+            self.assertTrue(np.array_equal(obs, expected_obs))
+            self.assertTrue(np.array_equal(r, expected_r))
+            self.assertTrue(np.array_equal(d, expected_d))
+
+    def test_step_matches_single_env(self):
+        envs = [NASimEnv(self.get_scenario()) for _ in range(self.N)]
+        for env in envs:
+            env.reset()
+        rng = np.random.RandomState(self.seed)
+        for t in range(2000):
+            actions = rng.randint(self.vec_env.get_num_actions(), size=self.N)
+            vec_obs, vec_r, vec_d, vec_info = self.vec_env.step(actions)
+            for i, env in enumerate(envs):
+                o, r, d, info = env.step(int(actions[i]))
+                self.assertTrue(np.array_equal(vec_obs[i], o.numpy_2D()))
+                self.assertAlmostEqual(vec_r[i], r)
+                self.assertEqual(vec_d[i], d)
+                self.assertEqual(vec_info["success"][i], info["success"])
+                if d:
+                    env.reset()
+            self.vec_env.reset(vec_d)
+
+
+if __name__ == "__main__":
+    unittest.main()
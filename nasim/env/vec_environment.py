@@ -0,0 +1,364 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from nasim.env.action import Action
+from nasim.env.network import Network, INTERNET
+from nasim.env.host_vector import COMPROMISED_IDX, REACHABLE_IDX, DISCOVERED_IDX
+from nasim.scenarios import ScenarioLoader, ScenarioGenerator
+
+
+class EnvStatic(NamedTuple):
+    """The static (i.e. unchanged after construction) arrays defining an environment.
+
+    All arrays are C-contiguous and read-only, so a single copy can be shared
+    between environments, and between processes (e.g. via the Ray object store).
+    """
+    # per host arrays
+    host_subnets: np.ndarray
+    host_values: np.ndarray
+    host_discovery_values: np.ndarray
+    host_services: np.ndarray
+    host_os: np.ndarray
+    initial_reachable: np.ndarray
+    sensitive_idxs: np.ndarray
+    # (num_hosts, host_vector_size) state with static value, service and os columns
+    state_template: np.ndarray
+    # network arrays
+    subnet_connectivity: np.ndarray
+    traffic_permitted: np.ndarray
+    # per action arrays, service and os are -1 for scans and exploits for any os
+    action_targets: np.ndarray
+    action_costs: np.ndarray
+    action_probs: np.ndarray
+    action_is_exploit: np.ndarray
+    action_is_subnet_scan: np.ndarray
+    action_services: np.ndarray
+    action_os: np.ndarray
+
+    @classmethod
+    def from_scenario(cls, scenario):
+        """Construct the static environment arrays for a scenario.
+
+        Arguments
+        ---------
+        scenario : Scenario
+            Scenario object, defining the properties of the environment
+
+        Returns
+        -------
+        EnvStatic
+            the static environment arrays
+        """
+        network = Network(scenario)
+        action_space = Action.load_action_space(scenario)
+        num_actions = len(action_space)
+
+        action_targets = np.zeros(num_actions, dtype=np.int32)
+        action_costs = np.zeros(num_actions, dtype=np.float32)
+        action_probs = np.zeros(num_actions, dtype=np.float32)
+        action_is_exploit = np.zeros(num_actions, dtype=bool)
+        action_is_subnet_scan = np.zeros(num_actions, dtype=bool)
+        action_services = np.full(num_actions, -1, dtype=np.int32)
+        action_os = np.full(num_actions, -1, dtype=np.int32)
+        for a_idx, a in enumerate(action_space):
+            action_targets[a_idx] = a.target_idx
+            action_costs[a_idx] = a.cost
+            action_probs[a_idx] = a.prob
+            action_is_exploit[a_idx] = a.is_exploit()
+            action_is_subnet_scan[a_idx] = a.is_subnet_scan()
+            if a.is_exploit():
+                action_services[a_idx] = network.service_idx_map[a.service]
+                if a.os is not None:
+                    action_os[a_idx] = network.os_idx_map[a.os]
+
+        arrays = dict(
+            host_subnets=network.host_subnets,
+            host_values=np.array([h.value for h in network.host_list], dtype=np.float32),
+            host_discovery_values=network.host_discovery_values.astype(np.float32),
+            host_services=network.host_services,
+            host_os=network.host_os,
+            initial_reachable=network.subnet_connectivity[network.host_subnets, INTERNET],
+            sensitive_idxs=np.array([network.host_num_map[addr]
+                                     for addr in network.get_sensitive_hosts()],
+                                    dtype=np.int32),
+            state_template=np.stack([h.numpy() for h in network.host_list]),
+            subnet_connectivity=network.subnet_connectivity,
+            traffic_permitted=network.traffic_permitted,
+            action_targets=action_targets,
+            action_costs=action_costs,
+            action_probs=action_probs,
+            action_is_exploit=action_is_exploit,
+            action_is_subnet_scan=action_is_subnet_scan,
+            action_services=action_services,
+            action_os=action_os
+        )
+        for name, arr in arrays.items():
+            arr = np.array(arr, order="C")
+            arr.flags.writeable = False
+            arrays[name] = arr
+        return cls(**arrays)
+
+    @property
+    def num_hosts(self):
+        return len(self.host_subnets)
+
+    @property
+    def num_subnets(self):
+        return len(self.subnet_connectivity)
+
+    @property
+    def num_services(self):
+        return self.host_services.shape[1]
+
+    @property
+    def num_actions(self):
+        return len(self.action_targets)
+
+
+class VecNASimEnv:
+    """A batch of independent copies of the same network attack simulator
+    environment, stepped together using numpy operations over the batch dimension.
+
+    Each environment in the batch follows the same dynamics as NASimEnv, but all
+    environment state is stored in arrays with a leading batch dimension so each
+    step costs a fixed number of numpy operations regardless of the batch size.
+
+    Properties
+    ----------
+    - num_envs : the number of environments in the batch
+    - static : the static environment arrays, shared by all environments in batch
+    - compromised : (num_envs, num_hosts) bool array of compromised hosts
+    - reachable : (num_envs, num_hosts) bool array of reachable hosts
+    - discovered : (num_envs, num_hosts) bool array of discovered hosts
+    - compromised_subnets : (num_envs, num_subnets) bool array of compromised subnets
+
+    N.B. Only the fully observable (MDP) mode is supported, so the observation
+    returned after each step is the state tensor of each environment. Actions are
+    referred to by their index in the scenario action space (see
+    Action.load_action_space).
+    """
+
+    def __init__(self, scenario, num_envs, seed=None):
+        """
+        Arguments
+        ---------
+        scenario : Scenario
+            Scenario object, defining the properties of the environment
+        num_envs : int
+            number of environments in batch
+        seed : int, optional
+            random number generator seed (default=None)
+        """
+        self.scenario = scenario
+        self._setup(EnvStatic.from_scenario(scenario), num_envs, seed)
+
+    def _setup(self, static, num_envs, seed):
+        assert 0 < num_envs
+        self.static = static
+        self.num_envs = num_envs
+        self._rng = np.random.default_rng(seed)
+        self.compromised = np.zeros((num_envs, static.num_hosts), dtype=bool)
+        self.reachable = np.zeros((num_envs, static.num_hosts), dtype=bool)
+        self.discovered = np.zeros((num_envs, static.num_hosts), dtype=bool)
+        self.compromised_subnets = np.zeros((num_envs, static.num_subnets), dtype=bool)
+        self._env_idxs = np.arange(num_envs)
+        self.reset()
+
+    @classmethod
+    def from_file(cls, path, num_envs, seed=None):
+        """Construct batch of environments from a scenario file.
+
+        Arguments
+        ---------
+        path : str
+            path to the scenario file
+        num_envs : int
+            number of environments in batch
+        seed : int, optional
+            random number generator seed (default=None)
+
+        Returns
+        -------
+        VecNASimEnv
+            a new vectorized environment object
+        """
+        loader = ScenarioLoader()
+        scenario = loader.load(path)
+        return cls(scenario, num_envs, seed)
+
+    @classmethod
+    def from_params(cls, num_hosts, num_services, num_envs, seed=None, **params):
+        """Construct batch of environments from an auto generated network.
+
+        Arguments
+        ---------
+        num_hosts : int
+            number of hosts to include in network (minimum is 3)
+        num_services : int
+            number of services to use in environment (minimum is 1)
+        num_envs : int
+            number of environments in batch
+        seed : int, optional
+            random number generator seed, used for both the scenario generator and
+            environment dynamics (default=None)
+        params : dict
+            generator params (see scenarios.generator for full list)
+
+        Returns
+        -------
+        VecNASimEnv
+            a new vectorized environment object
+        """
+        generator = ScenarioGenerator()
+        scenario = generator.generate(num_hosts, num_services, seed=seed, **params)
+        return cls(scenario, num_envs, seed)
+
+    @classmethod
+    def from_static(cls, static, num_envs, seed=None):
+        """Construct batch of environments from existing static environment arrays,
+        without copying them.
+
+        Arguments
+        ---------
+        static : EnvStatic
+            the static environment arrays
+        num_envs : int
+            number of environments in batch
+        seed : int, optional
+            random number generator seed (default=None)
+
+        Returns
+        -------
+        VecNASimEnv
+            a new vectorized environment object
+        """
+        env = cls.__new__(cls)
+        env.scenario = None
+        env._setup(static, num_envs, seed)
+        return env
+
+    def reset(self, mask=None):
+        """Reset the state of environments in batch and return the current state
+        of all environments.
+
+        Arguments
+        ---------
+        mask : ndarray, optional
+            (num_envs, ) bool array of environments to reset, if None resets all
+            environments (default=None)
+
+        Returns
+        -------
+        ndarray
+            (num_envs, num_hosts, host_vector_size) state of each environment
+        """
+        if mask is None:
+            mask = np.ones(self.num_envs, dtype=bool)
+        self.compromised[mask] = False
+        self.reachable[mask] = self.static.initial_reachable
+        self.discovered[mask] = self.static.initial_reachable
+        self.compromised_subnets[mask] = False
+        self.compromised_subnets[mask, INTERNET] = True
+        return self.get_state()
+
+    def step(self, actions):
+        """Run one step of each environment in batch using one action per environment.
+
+        N.B. environments are not reset automatically once done, see reset method.
+
+        info
+        ----
+        "success" : ndarray
+            bool array of whether each action was successful
+
+        Arguments
+        ---------
+        actions : ndarray
+            (num_envs, ) array of action space indices
+
+        Returns
+        -------
+        obs : ndarray
+            (num_envs, num_hosts, host_vector_size) state of each environment
+        rewards : ndarray
+            (num_envs, ) reward from performing each action
+        dones : ndarray
+            (num_envs, ) whether each episode has ended or not
+        info : dict
+            other information regarding step
+        """
+        actions = np.asarray(actions)
+        assert actions.shape == (self.num_envs, ), \
+            f"Step actions must be array of shape ({self.num_envs}, )"
+        s = self.static
+        envs = self._env_idxs
+        targets = s.action_targets[actions]
+        tgt_subnets = s.host_subnets[targets]
+        services = s.action_services[actions]
+        os = s.action_os[actions]
+        is_exploit = s.action_is_exploit[actions]
+        is_subnet_scan = s.action_is_subnet_scan[actions]
+        tgt_compromised = self.compromised[envs, targets]
+
+        valid = self.reachable[envs, targets] & self.discovered[envs, targets]
+        permitted = (s.traffic_permitted[:, tgt_subnets, services].T
+                     & self.compromised_subnets).any(axis=1)
+        valid &= ~is_exploit | permitted
+        # exploits against already compromised hosts are not stochastic
+        rand_ok = self._rng.random(self.num_envs) <= s.action_probs[actions]
+        performed = valid & (rand_ok | (is_exploit & tgt_compromised))
+
+        exploit_ok = s.host_services[targets, services] \
+            & ((os == -1) | s.host_os[targets, os])
+        success = performed & np.where(is_exploit, exploit_ok,
+                                       ~is_subnet_scan | tgt_compromised)
+
+        # only exploits and subnet scans change the state of environment
+        exploited = success & is_exploit
+        scanned = success & is_subnet_scan
+        connected = s.subnet_connectivity[tgt_subnets][:, s.host_subnets]
+        newly_compromised = exploited & ~tgt_compromised
+        newly_discovered = connected & scanned[:, None] & ~self.discovered
+
+        values = np.where(newly_compromised, s.host_values[targets], 0.0)
+        values += newly_discovered @ s.host_discovery_values
+
+        self.compromised[envs[exploited], targets[exploited]] = True
+        self.compromised_subnets[envs[exploited], tgt_subnets[exploited]] = True
+        self.reachable |= connected & exploited[:, None]
+        self.discovered |= newly_discovered
+
+        rewards = values - s.action_costs[actions]
+        dones = self.compromised[:, s.sensitive_idxs].all(axis=1)
+        return self.get_state(), rewards, dones, {"success": success}
+
+    def get_state(self):
+        """Get the state of each environment in batch as a tensor.
+
+        Returns
+        -------
+        ndarray
+            (num_envs, num_hosts, host_vector_size) state of each environment
+        """
+        state = np.repeat(self.static.state_template[None], self.num_envs, axis=0)
+        state[:, :, COMPROMISED_IDX] = self.compromised
+        state[:, :, REACHABLE_IDX] = self.reachable
+        state[:, :, DISCOVERED_IDX] = self.discovered
+        return state
+
+    def get_num_actions(self):
+        """Get the size of the action space for each environment
+
+        Returns
+        -------
+        num_actions : int
+            action space size
+        """
+        return self.static.num_actions
+
+    def __str__(self):
+        output = f"VecEnvironment: Envs = {self.num_envs}, "
+        output += "Hosts = {}, ".format(self.static.num_hosts)
+        output += "Services = {}, ".format(self.static.num_services)
+        return output